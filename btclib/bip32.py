@@ -34,7 +34,12 @@ A BIP32 extended key is 78 bytes:
 
 import copy
 import hmac
-from typing import List, Optional, Tuple
+import re
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from os import cpu_count
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 from . import bip39, electrum
 from .alias import INF, BIP32Key, BIP32KeyDict, Octets, Path, Point
@@ -46,27 +51,65 @@ from .network import (
     _NETWORKS,
     _P2WPKH_PRV_PREFIXES,
     _XPRV_PREFIXES,
-    _XPRV_VERSIONS_ALL,
-    _XPUB_VERSIONS_ALL,
+    _XPRV_VERSIONS_SET,
+    _XPUB_VERSION_FROM_XPRV,
+    _XPUB_VERSIONS_SET,
     NETWORKS,
 )
-from .secpoint import bytes_from_point, point_from_octets
+from .secpoint import point_from_octets
 from .utils import bytes_from_octets, hash160
 
+# optional libsecp256k1 bindings for the secp256k1 curve arithmetic,
+# available with "pip install btclib[secp256k1]"; the libsecp256k1
+# branches are excluded from coverage, as CI runs without them
+try:
+    from coincurve import PublicKey as _Secp256k1PubKey
+except ImportError:
+    _Secp256k1PubKey = None  # type: ignore
+
+# version, depth, parent_fingerprint, index, chain_code, key
+_XKEY_STRUCT = struct.Struct(">4sB4s4s32s33s")
+
 
 class ExtendedBIP32KeyDict(BIP32KeyDict):
     # extensions used to cache intemediate results
     # in multi-level derivation: do not rely on them elsewhere
     q: int  # non-zero for private key only
-    Q: Point  # non-Infinity for public key only
+    Q: Point  # non-Infinity for public key only (not used by libsecp256k1)
+
+
+def _bytes_from_point(Q: Point) -> bytes:
+    # secp256k1 compressed SEC encoding of a point computed here,
+    # i.e. already known to be on curve: skip the generic checks
+
+    if Q[1] == 0:  # infinity point in affine coordinates
+        raise ValueError("No bytes representation for the infinity point")
+    return (b"\x03" if (Q[1] & 1) else b"\x02") + Q[0].to_bytes(32, "big")
+
+
+def _pubkey_from_prvkey(q: int) -> bytes:
+
+    if _Secp256k1PubKey is not None:  # pragma: no cover
+        return _Secp256k1PubKey.from_secret(q.to_bytes(32, "big")).format()
+    return _bytes_from_point(mult(q))
+
+
+def _pubkey_tweak_add(key: bytes, Q: Point, tweak: bytes) -> Tuple[bytes, Point]:
+    # return the (key, Q) public key of (key, Q) + tweak*G
+
+    if _Secp256k1PubKey is not None:  # pragma: no cover
+        return _Secp256k1PubKey(key).add(tweak).format(), INF
+    # both points are on curve: _add_aff without checks
+    Q = ec._add_aff(Q, mult(int.from_bytes(tweak, byteorder="big")))
+    return _bytes_from_point(Q), Q
 
 
 def _check_version_key(version: bytes, key: bytes) -> None:
 
-    if version in _XPRV_VERSIONS_ALL:
+    if version in _XPRV_VERSIONS_SET:
         if key[0] != 0:
             raise ValueError("prv_version/pubkey mismatch")
-    elif version in _XPUB_VERSIONS_ALL:
+    elif version in _XPUB_VERSIONS_SET:
         if key[0] not in (2, 3):
             raise ValueError("pub_version/prvkey mismatch")
     else:
@@ -115,13 +158,14 @@ def deserialize(xkey: BIP32Key) -> ExtendedBIP32KeyDict:
         if isinstance(xkey, str):
             xkey = xkey.strip()
         xkey = b58decode(xkey, 78)
+        version, depth, pfp, index, chain_code, key = _XKEY_STRUCT.unpack(xkey)
         d = {
-            "version": xkey[:4],
-            "depth": xkey[4],
-            "parent_fingerprint": xkey[5:9],
-            "index": xkey[9:13],
-            "chain_code": xkey[13:45],
-            "key": xkey[45:],
+            "version": version,
+            "depth": depth,
+            "parent_fingerprint": pfp,
+            "index": index,
+            "chain_code": chain_code,
+            "key": key,
             # extensions
             "q": 0,  # non zero only if xprv
             "Q": INF,  # non INF only if xpub
@@ -151,7 +195,6 @@ def serialize(d: BIP32KeyDict) -> bytes:
         raise ValueError(m)
     # version length is checked in _check_version_key
     _check_version_key(d["version"], d["key"])
-    t = d["version"]
 
     if len(d["parent_fingerprint"]) != 4:
         m = f"Invalid {len(d['parent_fingerprint'])}-bytes "
@@ -161,23 +204,26 @@ def serialize(d: BIP32KeyDict) -> bytes:
         m = f"Invalid {len(d['index'])}-bytes BIP32 index length"
         raise ValueError(m)
     _check_depth_pfp_index(d["depth"], d["parent_fingerprint"], d["index"])
-    t += d["depth"].to_bytes(1, "big")
-    t += d["parent_fingerprint"]
-    t += d["index"]
 
     if len(d["chain_code"]) != 32:
         m = f"Invalid {len(d['chain_code'])}-bytes BIP32 chain_code length"
         raise ValueError(m)
-    t += d["chain_code"]
-
-    # already checked in _check_version_key
-    t += d["key"]
 
+    # all field sizes have been checked: pack the 78 bytes at once
+    t = _XKEY_STRUCT.pack(
+        d["version"],
+        d["depth"],
+        d["parent_fingerprint"],
+        d["index"],
+        d["chain_code"],
+        d["key"],
+    )
     return b58encode(t, 78)
 
 
-def rootxprv_from_seed(seed: Octets, version: Optional[Octets] = None) -> bytes:
-    """Return BIP32 root master extended private key from seed."""
+def _rootxprv_dict_from_seed(
+    seed: Octets, version: Optional[Octets] = None
+) -> BIP32KeyDict:
 
     seed = bytes_from_octets(seed)
     hd = hmac.digest(b"Bitcoin seed", seed, "sha512")
@@ -186,7 +232,7 @@ def rootxprv_from_seed(seed: Octets, version: Optional[Octets] = None) -> bytes:
         v = NETWORKS["mainnet"]["bip32_prv"]
     else:
         v = bytes_from_octets(version)
-    if v not in _XPRV_VERSIONS_ALL:
+    if v not in _XPRV_VERSIONS_SET:
         raise ValueError(f"unknown extended private key version {v!r}")
 
     d: BIP32KeyDict = {
@@ -197,7 +243,13 @@ def rootxprv_from_seed(seed: Octets, version: Optional[Octets] = None) -> bytes:
         "chain_code": hd[32:],
         "key": k,
     }
-    return serialize(d)
+    return d
+
+
+def rootxprv_from_seed(seed: Octets, version: Optional[Octets] = None) -> bytes:
+    """Return BIP32 root master extended private key from seed."""
+
+    return serialize(_rootxprv_dict_from_seed(seed, version))
 
 
 def mxprv_from_bip39_mnemonic(
@@ -226,7 +278,8 @@ def mxprv_from_electrum_mnemonic(
         return rootxprv_from_seed(seed, xversion)
     elif version == "segwit":
         xversion = _P2WPKH_PRV_PREFIXES[network_index]
-        rootxprv = rootxprv_from_seed(seed, xversion)
+        # no need for a base58 round-trip of the root key
+        rootxprv = _rootxprv_dict_from_seed(seed, xversion)
         return derive(rootxprv, 0x80000000)  # "m/0h"
     else:
         raise ValueError(f"Unmanaged electrum mnemonic version ({version})")
@@ -239,78 +292,99 @@ def xpub_from_xprv(xprv: BIP32Key) -> bytes:
     private key (“neutered” as it removes the ability to sign transactions).
     """
 
-    if isinstance(xprv, dict):
-        xprv = copy.copy(xprv)
-    else:
-        xprv = deserialize(xprv)
+    # deserialize returns a new dict, with the already converted int q
+    xprv = deserialize(xprv)
 
     if xprv["key"][0] != 0:
         raise ValueError(f"Not a private key: {serialize(xprv).decode()}")
 
-    i = _XPRV_VERSIONS_ALL.index(xprv["version"])
-    xprv["version"] = _XPUB_VERSIONS_ALL[i]
+    xprv["version"] = _XPUB_VERSION_FROM_XPRV[xprv["version"]]
 
-    q = int.from_bytes(xprv["key"][1:], byteorder="big")
-    Q = mult(q)
-    xprv["key"] = bytes_from_point(Q)
+    xprv["key"] = _pubkey_from_prvkey(xprv["q"])
 
     return serialize(xprv)
 
 
-def _ckd(d: ExtendedBIP32KeyDict, index: bytes) -> None:
+def _ckd_many(
+    d: ExtendedBIP32KeyDict, indexes: List[bytes]
+) -> List[ExtendedBIP32KeyDict]:
 
-    # d is a prvkey
+    # the parent public key (and its fingerprint) is computed only once;
+    # the parent chain code keys the HMAC for all the children:
+    # the keyed HMAC, already fed with the parent key,
+    # is copied for each child instead of being rebuilt from scratch
     if d["key"][0] == 0:
-        d["depth"] += 1
-        Pbytes = bytes_from_point(mult(d["q"]))
-        d["parent_fingerprint"] = hash160(Pbytes)[:4]
-        d["index"] = index
+        # not threaded from the previous level as parent + offset*G:
+        # it would cost the same multiplication of G (plus an addition)
+        # and it would be wasted at the last derivation level
+        Pbytes = _pubkey_from_prvkey(d["q"])
+        hardened_hmac = hmac.new(d["chain_code"], d["key"], "sha512")
+    else:
+        Pbytes = d["key"]
+    normal_hmac = hmac.new(d["chain_code"], Pbytes, "sha512")
+    parent_fingerprint = hash160(Pbytes)[:4]
+
+    children: List[ExtendedBIP32KeyDict] = list()
+    for index in indexes:
+        c = copy.copy(d)
+        c["depth"] += 1
+        c["parent_fingerprint"] = parent_fingerprint
+        c["index"] = index
         if index[0] >= 0x80:  # hardened derivation
-            h = hmac.digest(d["chain_code"], d["key"] + index, "sha512")
+            if d["key"][0] != 0:
+                raise ValueError("hardened derivation from pubkey is impossible")
+            h_obj = hardened_hmac.copy()
         else:  # normal derivation
-            h = hmac.digest(d["chain_code"], Pbytes + index, "sha512")
-        d["chain_code"] = h[32:]
-        offset = int.from_bytes(h[:32], byteorder="big")
-        d["q"] = (d["q"] + offset) % ec.n
-        d["key"] = b"\x00" + d["q"].to_bytes(32, "big")
-        d["Q"] = INF
-    # d is a pubkey
-    else:
-        if index[0] >= 0x80:
-            raise ValueError("hardened derivation from pubkey is impossible")
-        d["depth"] += 1
-        d["parent_fingerprint"] = hash160(d["key"])[:4]
-        d["index"] = index
-        h = hmac.digest(d["chain_code"], d["key"] + index, "sha512")
-        d["chain_code"] = h[32:]
-        offset = int.from_bytes(h[:32], byteorder="big")
-        Offset = mult(offset)
-        d["Q"] = ec.add(d["Q"], Offset)
-        d["key"] = bytes_from_point(d["Q"])
-        d["q"] = 0
+            h_obj = normal_hmac.copy()
+        h_obj.update(index)
+        h = h_obj.digest()
+        c["chain_code"] = h[32:]
+        # c is a prvkey
+        if d["key"][0] == 0:
+            offset = int.from_bytes(h[:32], byteorder="big")
+            c["q"] = (d["q"] + offset) % ec.n
+            c["key"] = b"\x00" + c["q"].to_bytes(32, "big")
+        # c is a pubkey
+        else:
+            c["key"], c["Q"] = _pubkey_tweak_add(d["key"], d["Q"], h[:32])
+        children.append(c)
+
+    return children
+
+
+def _ckd(d: ExtendedBIP32KeyDict, index: bytes) -> None:
+    # in place single child derivation
+
+    d.update(_ckd_many(d, [index])[0])
+
+
+# the path after its root: slash-prefixed, possibly empty, steps;
+# each whitespace run can be matched in one way only,
+# avoiding catastrophic backtracking on invalid paths
+_PATH_STEPS = re.compile(r"(?:/\s*(?:[0-9]+(?:\s*['hH])?\s*)?)*")
+# a single step: index and (optional) hardened derivation marker
+_PATH_STEP = re.compile(r"([0-9]+)\s*(['hH]?)")
 
 
 def _indexes_from_path(path: str) -> Tuple[List[bytes], bool]:
 
-    steps = [x.strip() for x in path.split("/")]
-    if steps[0] in ("m", "M"):
+    root, slash, steps = path.partition("/")
+    root = root.strip()
+    if root in ("m", "M"):
         absolute = True
-    elif steps[0] == ".":
+    elif root == ".":
         absolute = False
-    elif steps[0] == "":
+    elif root == "":
         raise ValueError("Empty derivation path")
     else:
-        raise ValueError(f"Invalid derivation path root: {steps[0]}")
-
-    indexes: List[bytes] = list()
-    for step in steps[1:]:
-        if step == "":  # extra slash
-            continue
-        elif step[-1] in ("'", "H", "h"):
-            index = int(step[:-1]) + 0x80000000
-        else:
-            index = int(step)
-        indexes.append(index.to_bytes(4, "big"))
+        raise ValueError(f"Invalid derivation path root: {root}")
+
+    if not _PATH_STEPS.fullmatch(slash + steps):
+        raise ValueError(f"Invalid derivation path: {path}")
+    indexes = [
+        (int(i) + (0x80000000 if h else 0)).to_bytes(4, "big")
+        for i, h in _PATH_STEP.findall(steps)
+    ]
 
     if len(indexes) > 255:
         raise ValueError(f"Derivation path depth {len(indexes)}>255")
@@ -359,22 +433,51 @@ def derive(xkey: BIP32Key, path: Path) -> bytes:
     return serialize(xkey)
 
 
+def derive_children(xkey: BIP32Key, indexes: Iterable[int]) -> List[bytes]:
+    """Derive the extended keys of many children of the same parent.
+
+    It is equivalent to [derive(xkey, i) for i in indexes],
+    but the work depending only on the parent key
+    is done just once for all the children.
+    """
+
+    d = deserialize(xkey)
+    if d["depth"] == 255:
+        raise ValueError("Derivation path final depth 256>255")
+
+    index_list = [i.to_bytes(4, byteorder="big") for i in indexes]
+    return [serialize(c) for c in _ckd_many(d, index_list)]
+
+
+def derive_many(
+    xkey: BIP32Key, paths: Sequence[Path], max_workers: Optional[int] = None
+) -> List[bytes]:
+    """Derive an extended key across many independent paths.
+
+    It is equivalent to [derive(xkey, path) for path in paths],
+    but derivations are distributed over a pool of max_workers processes
+    (default: the number of CPUs).
+    Starting the pool has a cost: it pays off only for many paths.
+    """
+
+    workers = (cpu_count() or 1) if max_workers is None else max_workers
+    # the executor rejects invalid (non-positive) max_workers
+    with ProcessPoolExecutor(workers) as executor:
+        chunksize = max(1, len(paths) // (4 * workers))
+        return list(executor.map(partial(derive, xkey), paths, chunksize=chunksize))
+
+
 def crack_prvkey(parent_xpub: BIP32Key, child_xprv: BIP32Key) -> bytes:
 
-    if isinstance(parent_xpub, dict):
-        p = copy.copy(parent_xpub)
-    else:
-        p = deserialize(parent_xpub)
+    # deserialize returns a new (validated) dict
+    p = deserialize(parent_xpub)
 
     if p["key"][0] not in (2, 3):
         m = "Extended parent key is not a public key: "
         m += f"{serialize(p).decode()}"
         raise ValueError(m)
 
-    if isinstance(child_xprv, dict):
-        c = child_xprv
-    else:
-        c = deserialize(child_xprv)
+    c = deserialize(child_xprv)
     if c["key"][0] != 0:
         m = f"Extended child key is not a private key: "
         m += f"{serialize(c).decode()}"
@@ -395,9 +498,8 @@ def crack_prvkey(parent_xpub: BIP32Key, child_xprv: BIP32Key) -> bytes:
     p["version"] = c["version"]
 
     h = hmac.digest(p["chain_code"], p["key"] + c["index"], "sha512")
-    child_q = int.from_bytes(c["key"][1:], byteorder="big")
     offset = int.from_bytes(h[:32], byteorder="big")
-    parent_q = (child_q - offset) % ec.n
+    parent_q = (c["q"] - offset) % ec.n
     p["key"] = b"\x00" + parent_q.to_bytes(32, byteorder="big")
 
     return serialize(p)
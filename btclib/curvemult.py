@@ -11,7 +11,7 @@
 """Elliptic curve point multiplication functions."""
 
 import heapq
-from typing import List, Sequence
+from typing import Dict, List, Sequence
 
 from .alias import INFJ, JacPoint, Point
 from .curve import Curve, CurveGroup, _jac_from_aff, _mult_jac
@@ -22,18 +22,59 @@ def mult(m: int, Q: Point = None, ec: Curve = secp256k1) -> Point:
     """Point multiplication, implemented using 'double and add'.
 
     Computations use Jacobian coordinates and binary decomposition of m.
+    Multiplication of the curve generator G (the default if Q is None)
+    uses precomputed multiples of G instead.
     """
-    if Q is None:
-        QJ = ec.GJ
+    m %= ec.n
+    if Q is None or Q == ec.G:
+        R = _mult_base(m, ec)
     else:
         ec.require_on_curve(Q)
-        QJ = _jac_from_aff(Q)
-
-    m %= ec.n
-    R = _mult_jac(m, QJ, ec)
+        R = _mult_jac(m, _jac_from_aff(Q), ec)
     return ec._aff_from_jac(R)
 
 
+# window width (bits) of the fixed-base multiplication tables
+_W = 4
+# per-curve tables of G multiples, built at first use
+_G_TABLES: Dict[Curve, List[List[JacPoint]]] = dict()
+
+
+def _g_table(ec: Curve) -> List[List[JacPoint]]:
+    # table[i][d] = d * 2^(_W*i) * G, for d in [0, 2^_W - 1]
+
+    table = _G_TABLES.get(ec)
+    if table is None:
+        table = list()
+        QJ = ec.GJ
+        for _ in range((ec.nlen + _W - 1) // _W):
+            row = [INFJ, QJ]
+            for _ in range(2, 1 << _W):
+                row.append(ec._add_jac(row[-1], QJ))
+            # Z=1 (affine) table points make the additions cheaper
+            row = [_jac_from_aff(ec._aff_from_jac(R)) for R in row]
+            table.append(row)
+            QJ = ec._add_jac(row[-1], QJ)
+        _G_TABLES[ec] = table
+    return table
+
+
+def _mult_base(m: int, ec: Curve) -> JacPoint:
+    # fixed-base multiplication of the generator G
+    # using the windowed (radix 2^_W) decomposition of m:
+    # at most one addition per window and no doublings at all
+    # m is assumed to have been reduced mod n
+
+    R = INFJ  # initialize as infinity point
+    mask = (1 << _W) - 1
+    for row in _g_table(ec):
+        if m == 0:
+            break
+        R = ec._add_jac(R, row[m & mask])
+        m >>= _W
+    return R
+
+
 def double_mult(u: int, H: Point, v: int, Q: Point, ec: Curve = secp256k1) -> Point:
     """Shamir trick for efficient computation of u*H + v*Q"""
 
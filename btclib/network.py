@@ -174,6 +174,11 @@ _XPRV_VERSIONS_ALL = _XPRV_VERSIONS_MAIN + _XPRV_VERSIONS_TEST + _XPRV_VERSIONS_
 _XPUB_VERSIONS_ALL = _XPUB_VERSIONS_MAIN + _XPUB_VERSIONS_TEST + _XPUB_VERSIONS_TEST
 _REPEATED_NETWORKS = [_NETWORKS[0]] * 5 + [_NETWORKS[1]] * 5 + [_NETWORKS[2]] * 5
 
+# hashed counterparts of the above, for constant time lookups
+_XPRV_VERSIONS_SET = frozenset(_XPRV_VERSIONS_ALL)
+_XPUB_VERSIONS_SET = frozenset(_XPUB_VERSIONS_ALL)
+_XPUB_VERSION_FROM_XPRV = dict(zip(_XPRV_VERSIONS_ALL, _XPUB_VERSIONS_ALL))
+
 
 def network_from_xkeyversion(xprvversion: bytes) -> str:
     """Return network string from the xkey version prefix.
@@ -191,6 +196,7 @@ def network_from_xkeyversion(xprvversion: bytes) -> str:
 
 
 _CURVES = [NETWORKS[net]["curve"] for net in NETWORKS]
+_CURVE_FROM_NETWORK = dict(zip(_NETWORKS, _CURVES))
 
 
 def curve_from_xpubversion(xpubversion: bytes) -> Curve:
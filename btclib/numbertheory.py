@@ -42,15 +42,16 @@ def xgcd(a: int, b: int) -> Tuple[int, int, int]:
 def mod_inv(a: int, m: int) -> int:
     """Return the inverse of a (mod m). m does not have to be a prime.
 
-    Based on Extended Euclidean Algorithm, see:
-    https://en.wikibooks.org/wiki/Algorithm_Implementation/Mathematics/Extended_Euclidean_algorithm
+    It relies on the built-in pow, available since python 3.8,
+    which is a C implementation of the Extended Euclidean Algorithm
+    (see xgcd for the pure python equivalent).
     """
 
     a %= m
-    g, x, _ = xgcd(a, m)
-    if g == 1:
-        return x % m
-    raise ValueError(f"{hex(a)} has no inverse (mod {hex(m)})")
+    try:
+        return pow(a, -1, m)
+    except ValueError:
+        raise ValueError(f"{hex(a)} has no inverse (mod {hex(m)})") from None
 
 
 def legendre_symbol(a, p) -> int:
@@ -11,22 +11,28 @@
 import json
 import unittest
 from os import path
+from unittest import mock
 
-from btclib import bip39
+from btclib import bip32, bip39
+from btclib.alias import INF
 from btclib.base58 import b58decode, b58encode
 from btclib.base58address import p2pkh, p2wpkh_p2sh
 from btclib.bech32address import p2wpkh
 from btclib.bip32 import (
     crack_prvkey,
     derive,
+    derive_children,
+    derive_many,
     deserialize,
     mxprv_from_bip39_mnemonic,
     rootxprv_from_seed,
     serialize,
     xpub_from_xprv,
 )
+from btclib.curvemult import mult
 from btclib.curves import secp256k1 as ec
 from btclib.network import NETWORKS
+from btclib.secpoint import bytes_from_point, point_from_octets
 
 
 class TestBIP32(unittest.TestCase):
@@ -233,6 +239,14 @@ class TestBIP32(unittest.TestCase):
         self.assertRaises(ValueError, derive, xprv, "invalid index")
         # derive(xprv, "invalid index")
 
+        # invalid derivation path step
+        self.assertRaises(ValueError, derive, xprv, "m/1/2hh")
+        # derive(xprv, "m/1/2hh")
+
+        # long invalid derivation path (no catastrophic regex backtracking)
+        self.assertRaises(ValueError, derive, xprv, "m" + "/1  " * 40 + "/x")
+        # derive(xprv, "m" + "/1  " * 40 + "/x")
+
         # a 4 bytes int is required, not 3
         self.assertRaises(ValueError, derive, xprv, "800000")
         # derive(xprv, "800000")
@@ -523,6 +537,82 @@ class TestBIP32(unittest.TestCase):
         exp = "xprv9s21ZrQH143K3ZxBCax3Wu25iWt3yQJjdekBuGrVa5LDAvbLeCT99U59szPSFdnMe5szsWHbFyo8g5nAFowWJnwe8r6DiecBXTVGHG124G1"
         self.assertEqual(rootxprv.decode(), exp)
 
+    def test_derive_children(self):
+        rootxprv = "xprv9s21ZrQH143K2ZP8tyNiUtgoezZosUkw9hhir2JFzDhcUWKz8qFYk3cxdgSFoCMzt8E2Ubi1nXw71TLhwgCfzqFHfM5Snv4zboSebePRmLS"
+        indexes = [0, 1, 0x80000000, 2, 0x80000001]
+        children = derive_children(rootxprv, indexes)
+        self.assertEqual(children, [derive(rootxprv, i) for i in indexes])
+
+        xpub = xpub_from_xprv(rootxprv)
+        indexes = [0, 1, 2]
+        children = derive_children(xpub, indexes)
+        self.assertEqual(children, [derive(xpub, i) for i in indexes])
+        self.assertEqual(children[1], xpub_from_xprv(derive(rootxprv, 1)))
+
+        # no private/hardened derivation from pubkey
+        self.assertRaises(ValueError, derive_children, xpub, [0, 0x80000000])
+        # derive_children(xpub, [0, 0x80000000])
+
+        # Derivation path final depth 256>255
+        xkey = deserialize(rootxprv)
+        xkey["depth"] = 255
+        xkey["parent_fingerprint"] = b"\x00\x00\x00\x01"
+        self.assertRaises(ValueError, derive_children, xkey, [0])
+        # derive_children(xkey, [0])
+
+    def test_derive_many(self):
+        rootxprv = "xprv9s21ZrQH143K2ZP8tyNiUtgoezZosUkw9hhir2JFzDhcUWKz8qFYk3cxdgSFoCMzt8E2Ubi1nXw71TLhwgCfzqFHfM5Snv4zboSebePRmLS"
+        paths = ["m/0h/0h/463h", [0x80000000, 1], "./1/2", 0, b"\x00\x00\x00\x05"]
+        xkeys = derive_many(rootxprv, paths, 2)
+        self.assertEqual(xkeys, [derive(rootxprv, path) for path in paths])
+
+        # errors are raised in the calling process
+        xpub = xpub_from_xprv(rootxprv)
+        self.assertRaises(ValueError, derive_many, xpub, ["./0", "./0h"], 2)
+        # derive_many(xpub, ["./0", "./0h"], 2)
+
+        # default pool size
+        self.assertEqual(derive_many(rootxprv, paths[:2]), xkeys[:2])
+
+        # invalid pool size
+        self.assertRaises(ValueError, derive_many, rootxprv, paths, 0)
+        # derive_many(rootxprv, paths, 0)
+
+    @unittest.skipIf(bip32._Secp256k1PubKey is None, "coincurve not installed")
+    def test_libsecp256k1_backend(self):
+        qs = [1, 2, ec.n - 1, 0xDEADBEEF, 2 ** 200 + 12345]
+        tweaks = [b"\x00" * 31 + b"\x02", bytes(range(32)), b"\x7f" * 32]
+
+        keys = [bip32._pubkey_from_prvkey(q) for q in qs]
+        results = [
+            bip32._pubkey_tweak_add(key, INF, tweak)[0]
+            for key in keys
+            for tweak in tweaks
+        ]
+
+        with mock.patch.object(bip32, "_Secp256k1PubKey", None):
+            pure_keys = [bip32._pubkey_from_prvkey(q) for q in qs]
+            self.assertEqual(keys, pure_keys)
+            pure_results = [
+                bip32._pubkey_tweak_add(key, point_from_octets(key), tweak)[0]
+                for key in pure_keys
+                for tweak in tweaks
+            ]
+            self.assertEqual(results, pure_results)
+
+        # (n-1)*G + 1*G is the infinity point
+        tweak = b"\x00" * 31 + b"\x01"
+        self.assertRaises(ValueError, bip32._pubkey_tweak_add, keys[2], INF, tweak)
+
+    def test_pubkey_tweak_add_infinity(self):
+        # (n-1)*G + 1*G is the infinity point
+        Q = mult(ec.n - 1)
+        key = bytes_from_point(Q)
+        tweak = b"\x00" * 31 + b"\x01"
+        with mock.patch.object(bip32, "_Secp256k1PubKey", None):
+            self.assertRaises(ValueError, bip32._pubkey_tweak_add, key, Q, tweak)
+            # bip32._pubkey_tweak_add(key, Q, tweak)
+
     def test_crack(self):
         parent_xpub = "xpub6BabMgRo8rKHfpAb8waRM5vj2AneD4kDMsJhm7jpBDHSJvrFAjHJHU5hM43YgsuJVUVHWacAcTsgnyRptfMdMP8b28LYfqGocGdKCFjhQMV"
         child_xprv = "xprv9xkG88dGyiurKbVbPH1kjdYrA8poBBBXa53RKuRGJXyruuoJUDd8e4m6poiz7rV8Z4NoM5AJNcPHN6aj8wRFt5CWvF8VPfQCrDUcLU5tcTm"
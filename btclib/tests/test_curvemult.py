@@ -14,7 +14,7 @@ from typing import List
 
 from btclib.alias import INF, INFJ
 from btclib.curve import _mult_aff, _mult_jac
-from btclib.curvemult import double_mult, mult, multi_mult
+from btclib.curvemult import _mult_base, double_mult, mult, multi_mult
 from btclib.curves import secp256k1
 from btclib.tests.test_curves import low_card_curves
 
@@ -66,6 +66,22 @@ class TestEllipticCurve(unittest.TestCase):
         # multi_mult(k, P, ec)
 
 
+def test_mult_base():
+    for ec in low_card_curves.values():
+        for q in range(ec.n):
+            Q = ec._aff_from_jac(_mult_jac(q, ec.GJ, ec))
+            assert ec._aff_from_jac(_mult_base(q, ec)) == Q
+            assert mult(q, None, ec) == mult(q, ec.G, ec)
+
+    ec = secp256k1
+    for q in (1, 2, ec.n - 1, 2 ** 255, secrets.randbits(ec.nlen) % ec.n):
+        Q = ec._aff_from_jac(_mult_jac(q, ec.GJ, ec))
+        assert mult(q) == Q
+        assert mult(q, ec.G) == Q
+    assert mult(0) == INF
+    assert mult(ec.n) == INF
+
+
 def test_double_mult():
     H = (
         0x50929B74C1A04954B78B4B6035E97A5E078A5A0F28EC96D547BFEE9ACE803AC0,
@@ -9,8 +9,9 @@
 # or distributed except according to the terms contained in the LICENSE file.
 
 import unittest
+from math import gcd
 
-from btclib.numbertheory import mod_inv, mod_sqrt
+from btclib.numbertheory import mod_inv, mod_sqrt, xgcd
 
 primes = [
     2,
@@ -56,6 +57,13 @@ primes = [
 
 
 class TestNumberTheory(unittest.TestCase):
+    def test_xgcd(self):
+        for a in range(100):
+            for b in range(100):
+                g, x, y = xgcd(a, b)
+                self.assertEqual(g, gcd(a, b))
+                self.assertEqual(a * x + b * y, g)
+
     def test_mod_inv_prime(self):
         for p in primes:
             # zero has no inverse
@@ -14,7 +14,12 @@ from btclib import bip32
 from btclib.base58 import b58encode
 from btclib.base58wif import wif_from_prvkey
 from btclib.curves import secp256k1 as ec
-from btclib.to_prvkey import int_from_prvkey, prvkeyinfo_from_prvkey
+from btclib.to_prvkey import (
+    _looks_like_wif,
+    _prvkeyinfo_from_wif,
+    int_from_prvkey,
+    prvkeyinfo_from_prvkey,
+)
 
 
 class TestToPrvKey(unittest.TestCase):
@@ -179,6 +184,26 @@ class TestToPrvKey(unittest.TestCase):
         self.assertRaises(ValueError, prvkeyinfo_from_prvkey, xprv, "testnet", True)
         # prvkeyinfo_from_prvkey(xprv, 'testnet', True)
 
+    def test_looks_like_wif(self):
+        xprv = "xprv9s21ZrQH143K3QTDL4LXw2F7HEK3wJUD2nW2nRk4stbPy6cq3jPPqjiChkVvvNKmPGJxWUtg6LnF5kejMRNNU3TGtRBeJgk33yuGBxrMPHi"
+        for network in ("mainnet", "testnet"):
+            for compressed in (True, False):
+                wif = wif_from_prvkey(1, network, compressed)
+                self.assertTrue(_looks_like_wif(wif))
+                self.assertTrue(_looks_like_wif(" " + wif.decode() + " "))
+        self.assertFalse(_looks_like_wif(xprv))
+        self.assertFalse(_looks_like_wif(xprv.encode()))
+        self.assertFalse(_looks_like_wif(""))
+        self.assertFalse(_looks_like_wif(b" "))
+
+    def test_prvkeyinfo_from_wif(self):
+        # Wrong WIF size (32): 0x80 prefix and 31-bytes private key
+        # (its leading character is not a WIF one, it would not
+        # be dispatched here by _prvkeyinfo_from_xprvwif)
+        wif = b58encode(b"\x80" + b"\x01" * 31)
+        self.assertRaises(ValueError, _prvkeyinfo_from_wif, wif)
+        # _prvkeyinfo_from_wif(wif)
+
 
 if __name__ == "__main__":
     # execute only if run as a script
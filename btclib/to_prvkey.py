@@ -16,7 +16,7 @@ from .base58 import b58decode
 from .curve import Curve
 from .curves import secp256k1
 from .network import (
-    NETWORKS,
+    _CURVE_FROM_NETWORK,
     network_from_key_value,
     network_from_xkeyversion,
     xprvversions_from_network,
@@ -43,7 +43,7 @@ def int_from_prvkey(prvkey: PrvKey, ec: Curve = secp256k1) -> int:
     elif isinstance(prvkey, dict):
         q, network, _ = _prvkeyinfo_from_xprvwif(prvkey)
         # q has been validated on the xprv/wif network
-        ec2 = NETWORKS[network]["curve"]
+        ec2 = _CURVE_FROM_NETWORK[network]
         assert ec == ec2, f"ec / network ({network}) mismatch"
         return q
     else:
@@ -53,7 +53,7 @@ def int_from_prvkey(prvkey: PrvKey, ec: Curve = secp256k1) -> int:
             pass
         else:
             # q has been validated on the xprv/wif network
-            ec2 = NETWORKS[network]["curve"]
+            ec2 = _CURVE_FROM_NETWORK[network]
             assert ec == ec2, f"ec / network ({network}) mismatch"
             return q
 
@@ -85,7 +85,7 @@ def _prvkeyinfo_from_wif(
     payload = b58decode(wif)
 
     network = network_from_key_value("wif", payload[0:1])
-    ec = NETWORKS[network]["curve"]
+    ec = _CURVE_FROM_NETWORK[network]
 
     if len(payload) == ec.nsize + 2:  # compressed WIF
         compr = True
@@ -141,6 +141,22 @@ def _prvkeyinfo_from_xprv(
         return q, network_from_xkeyversion(xprv["version"]), True
 
 
+# base58 leading characters of a WIF:
+# '5' (uncompressed) or 'K', 'L' (compressed) on mainnet,
+# '9' (uncompressed) or 'c' (compressed) on testnet/regtest;
+# BIP32 extended keys start with none of them
+_WIF_LEADING_CHARS = frozenset("5KL9c")
+
+
+def _looks_like_wif(wif: String) -> bool:
+
+    wif = wif.strip()
+    if not wif:
+        return False
+    leading_char = chr(wif[0]) if isinstance(wif, bytes) else wif[0]
+    return leading_char in _WIF_LEADING_CHARS
+
+
 def _prvkeyinfo_from_xprvwif(
     xprvwif: BIP32Key, network: Optional[str] = None, compressed: Optional[bool] = None
 ) -> PrvKeyInfo:
@@ -149,11 +165,9 @@ def _prvkeyinfo_from_xprvwif(
     Support WIF or BIP32 xprv.
     """
 
-    if not isinstance(xprvwif, dict):
-        try:
-            return _prvkeyinfo_from_wif(xprvwif, network, compressed)
-        except Exception:
-            pass
+    # dispatch on the leading character, not on a failed WIF decoding
+    if not isinstance(xprvwif, dict) and _looks_like_wif(xprvwif):
+        return _prvkeyinfo_from_wif(xprvwif, network, compressed)
 
     return _prvkeyinfo_from_xprv(xprvwif, network, compressed)
 
@@ -164,7 +178,7 @@ def prvkeyinfo_from_prvkey(
 
     compr = True if compressed is None else compressed
     net = "mainnet" if network is None else network
-    ec = NETWORKS[net]["curve"]
+    ec = _CURVE_FROM_NETWORK[net]
 
     if isinstance(prvkey, int):
         q = prvkey
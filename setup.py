@@ -22,6 +22,7 @@ setup(
     long_description=longdescription,
     long_description_content_type="text/markdown",
     packages=find_packages(),
+    extras_require={"secp256k1": ["coincurve"]},
     include_package_data=True,
     package_data={"btclib": ["data/*", "tests/test_data/*"],},
     test_suite="btclib.tests",